@@ -1,63 +1,183 @@
-import random
+from __future__ import annotations
+
+import functools
 import math
-from typing import List, Dict, Tuple, Optional
+import numbers
+import random
+import sys
+from array import array
+from typing import List, Dict, Tuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy работают запасные пути на чистом Python
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # без Numba ядра выполняются как обычные функции Python
+    prange = range
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _process_kernel(arr: np.ndarray) -> np.ndarray:
+    """Поэлементное преобразование: квадрат/корень и приведение к диапазону"""
+    n = arr.size
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        x = arr[i]
+        # Четность через младший бит: в дополнительном коде верно и для
+        # отрицательных чисел, и векторизуется проще, чем x % 2
+        r = float(x * x) if (x & 1) == 0 else math.sqrt(abs(x))
+        # Приведение к диапазону без ветвлений: множители выбираются через select.
+        # Деление на 10 (а не умножение на 0.1) сохраняет результат бит в бит
+        up = 10.0 if r < 1.0 else 1.0
+        down = 10.0 if r > 100.0 else 1.0
+        out[i] = r * up / down
+    return out
+
+def _transform(num: int) -> float:
+    """Скалярное преобразование на числах Python (запасной путь для ядра)"""
+    # % 2, а не & 1: на этот путь попадают и дробные числа
+    res = num * num if num % 2 == 0 else math.sqrt(abs(num))
+    if res > 100:
+        return res / 10
+    if res < 1:
+        return res * 10
+    return res
+
+# Ядро считает x * x в int64 и переводит в float64. Результат точен (и совпадает
+# с _transform на длинных целых), только пока x * x <= 2**53
+_KERNEL_MAX_ABS = 94906265
+
+def _kernel_input(data: np.ndarray) -> Optional[np.ndarray]:
+    """int64-массив для _process_kernel или None, если данные нужно считать на Python"""
+    # Дробные, длинные (dtype object) и прочие нецелые данные в ядро не идут:
+    # приведение к int64 молча обрезало бы дроби и заворачивало бы uint64
+    if data.dtype.kind not in 'iu':
+        return None
+    if data.max() > _KERNEL_MAX_ABS or data.min() < -_KERNEL_MAX_ABS:
+        return None
+    return data.astype(np.int64, copy=False)
+
+if np is not None:
+    # Компиляция (или загрузка из кэша) при импорте, а не на первом вызове
+    _process_kernel(np.zeros(1, dtype=np.int64))
+
+@njit(cache=True)
+def _stats_kernel(a: np.ndarray) -> Tuple[float, float, float, float]:
+    """Среднее, стандартное отклонение, минимум и максимум за один проход (Welford)"""
+    # Без fastmath: ядро должно корректно видеть NaN и inf во входе
+    mean = 0.0
+    m2 = 0.0
+    total = 0.0
+    finite = True
+    n = len(a)
+    mn = a[0]
+    mx = a[0]
+    for i in range(n):
+        x = a[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += (x - mean) * delta
+        total += x
+        if not math.isfinite(x):
+            finite = False
+        if x < mn:
+            mn = x
+        if x > mx:
+            mx = x
+    if not finite:
+        # На inf поправка Welford дает inf - inf = NaN; как и прямая формула,
+        # берем среднее как сумму / n, а отклонение от бесконечного среднего — NaN
+        return total / n, math.nan, float(mn), float(mx)
+    return float(mean), math.sqrt(m2 / n), float(mn), float(mx)
+
+# F(92) — последнее число Фибоначчи, помещающееся в int64
+_FIB_INT64_MAX_LENGTH = 93
+
+@njit(cache=True)
+def _fib_kernel(n: int) -> np.ndarray:
+    """Первые n (n >= 1) чисел Фибоначчи в массиве int64"""
+    out = np.empty(n, dtype=np.int64)
+    out[0] = 0
+    if n > 1:
+        out[1] = 1
+    for i in range(2, n):
+        out[i] = out[i - 1] + out[i - 2]
+    return out
+
+_rng = np.random.default_rng() if np is not None else None
 
 class DataProcessor:
     def __init__(self, data: List[int]):
         self.data = data
         self._processed = False
-        self._results = None
+        self._results_arr: Optional[np.ndarray | array] = None
+        self._stats_cache: Optional[Dict[str, float]] = None
+        self._version = 0
+        self._cached_version = -1
     
     def process_data(self) -> None:
         """Обрабатывает данные, выполняя различные операции"""
-        if not self.data:
+        if len(self.data) == 0:
             raise ValueError("Данные не могут быть пустыми")
         
-        temp_results = []
-        for num in self.data:
-            # Первая операция
-            if num % 2 == 0:
-                res = num ** 2
+        if np is None:
+            self._results_arr = array('d', map(_transform, self.data))
+        else:
+            data = np.asarray(self.data)
+            arr = _kernel_input(data)
+            if arr is None:
+                # tolist() дает числа Python: длинные целые не переполняются, как без NumPy
+                self._results_arr = np.fromiter(map(_transform, data.tolist()), dtype=np.float64, count=data.size)
             else:
-                res = math.sqrt(abs(num))
-            
-            # Вторая операция
-            if res > 100:
-                res = res / 10
-            elif res < 1:
-                res = res * 10
-            
-            temp_results.append(res)
-        
-        self._results = temp_results
+                self._results_arr = _process_kernel(arr)
+        self._version += 1
         self._processed = True
     
+    @property
+    def version(self) -> int:
+        """Номер последней обработки; увеличивается при каждом process_data"""
+        return self._version
+    
     def get_results(self) -> List[float]:
         if not self._processed:
             self.process_data()
-        return self._results
+        return self._results_arr.tolist()
+    
+    def get_results_array(self) -> np.ndarray | array:
+        """Возвращает результаты в виде непрерывного массива float64 (array('d') без NumPy)"""
+        if not self._processed:
+            self.process_data()
+        return self._results_arr
     
     def calculate_stats(self) -> Dict[str, float]:
         if not self._processed:
             self.process_data()
         
-        stats = {
-            'mean': sum(self._results) / len(self._results),
-            'max': max(self._results),
-            'min': min(self._results),
-            'std_dev': self._calculate_std_dev()
-        }
-        return stats
+        if self._cached_version != self._version:
+            mean, std_dev, min_val, max_val = _stats_kernel(self._results_arr)
+            self._stats_cache = {
+                'mean': mean,
+                'max': max_val,
+                'min': min_val,
+                'std_dev': std_dev
+            }
+            self._cached_version = self._version
+        return dict(self._stats_cache)
     
     def _calculate_std_dev(self) -> float:
-        mean = sum(self._results) / len(self._results)
-        variance = sum((x - mean) ** 2 for x in self._results) / len(self._results)
-        return math.sqrt(variance)
+        return self.calculate_stats()['std_dev']
 
 class DataGenerator:
     @staticmethod
-    def generate_random_data(size: int = 100) -> List[int]:
-        return [random.randint(-50, 50) for _ in range(size)]
+    def generate_random_data(size: int = 100) -> np.ndarray | List[int]:
+        if np is None:
+            return [random.randint(-50, 50) for _ in range(size)]
+        return _rng.integers(-50, 51, size=size, dtype=np.int64)
     
     @staticmethod
     def generate_fibonacci_sequence(length: int) -> List[int]:
@@ -65,73 +185,110 @@ class DataGenerator:
             return []
         elif length == 1:
             return [0]
+        elif np is not None and length <= _FIB_INT64_MAX_LENGTH:
+            return _fib_kernel(length).tolist()
         
-        sequence = [0, 1]
-        while len(sequence) < length:
-            sequence.append(sequence[-1] + sequence[-2])
-        return sequence[:length]
+        # Дальше int64 переполняется (или нет NumPy) — считаем на длинных целых Python
+        sequence = [0] * length
+        sequence[1] = 1
+        for i in range(2, length):
+            sequence[i] = sequence[i - 1] + sequence[i - 2]
+        return sequence
 
 class DataAnalyzer:
     def __init__(self, processor: DataProcessor):
         self.processor = processor
+        self._results_view: Optional[np.ndarray | array] = None
+        self._results_version = -1
+    
+    @property
+    def results(self) -> np.ndarray | array:
+        """Массив результатов процессора; запоминается до следующего process_data"""
+        if self._results_version != self.processor.version:
+            self._results_view = self.processor.get_results_array()
+            self._results_version = self.processor.version
+        return self._results_view
     
-    def find_outliers(self, threshold: float = 2.0) -> List[Tuple[int, float]]:
-        results = self.processor.get_results()
-        stats = self.processor.calculate_stats()
+    def find_outliers(self, threshold: float = 2.0,
+                      stats: Optional[Dict[str, float]] = None) -> List[Tuple[int, float]]:
+        """Ищет выбросы; stats можно передать, если статистика уже посчитана"""
+        arr = self.results
+        if stats is None:
+            stats = self.processor.calculate_stats()
         mean = stats['mean']
         std_dev = stats['std_dev']
         
-        outliers = []
-        for idx, value in enumerate(results):
-            if abs(value - mean) > threshold * std_dev:
-                outliers.append((idx, value))
-        return outliers
+        if np is None:
+            limit = threshold * std_dev
+            return [(idx, value) for idx, value in enumerate(arr) if abs(value - mean) > limit]
+        
+        mask = np.abs(arr - mean) > threshold * std_dev
+        idx = np.flatnonzero(mask)
+        return list(zip(idx.tolist(), arr[mask].tolist()))
     
     def group_values(self) -> Dict[str, List[float]]:
-        results = self.processor.get_results()
-        groups = {
-            'low': [],
-            'medium': [],
-            'high': []
-        }
+        arr = self.results
+        if np is None:
+            groups = {'low': [], 'medium': [], 'high': []}
+            add_low, add_medium, add_high = (groups['low'].append,
+                                             groups['medium'].append,
+                                             groups['high'].append)
+            for value in arr:
+                if value < 10:
+                    add_low(value)
+                elif value <= 50:
+                    add_medium(value)
+                else:
+                    add_high(value)
+            return groups
         
-        for value in results:
-            if value < 10:
-                groups['low'].append(value)
-            elif 10 <= value <= 50:
-                groups['medium'].append(value)
-            else:
-                groups['high'].append(value)
+        low = arr < 10
+        high = arr > 50
+        medium = ~(low | high)
         
+        groups = {
+            'low': arr[low].tolist(),
+            'medium': arr[medium].tolist(),
+            'high': arr[high].tolist()
+        }
         return groups
 
+_REPORT_TEMPLATE = (
+    "=== Статистический отчет ===\n"
+    "Среднее значение: {mean:.2f}\n"
+    "Максимальное значение: {max:.2f}\n"
+    "Минимальное значение: {min:.2f}\n"
+    "Стандартное отклонение: {std_dev:.2f}\n"
+    "\n=== Выбросы ===\n"
+    "{outliers}"
+    "\n=== Группировка значений ===\n"
+    "Низкие значения (кол-во): {low}\n"
+    "Средние значения (кол-во): {medium}\n"
+    "Высокие значения (кол-во): {high}"
+)
+
 class ReportGenerator:
     @staticmethod
     def generate_text_report(analyzer: DataAnalyzer) -> str:
         stats = analyzer.processor.calculate_stats()
-        outliers = analyzer.find_outliers()
+        outliers = analyzer.find_outliers(stats=stats)
         groups = analyzer.group_values()
         
-        report = []
-        report.append("=== Статистический отчет ===")
-        report.append(f"Среднее значение: {stats['mean']:.2f}")
-        report.append(f"Максимальное значение: {stats['max']:.2f}")
-        report.append(f"Минимальное значение: {stats['min']:.2f}")
-        report.append(f"Стандартное отклонение: {stats['std_dev']:.2f}")
-        report.append("\n=== Выбросы ===")
-        for idx, value in outliers:
-            report.append(f"Индекс {idx}: {value:.2f}")
-        report.append("\n=== Группировка значений ===")
-        report.append(f"Низкие значения (кол-во): {len(groups['low'])}")
-        report.append(f"Средние значения (кол-во): {len(groups['medium'])}")
-        report.append(f"Высокие значения (кол-во): {len(groups['high'])}")
-        
-        return "\n".join(report)
+        # Каждая строка выброса заканчивается переводом строки — шаблон не добавляет своих
+        outliers_block = "".join(f"Индекс {idx}: {value:.2f}\n" for idx, value in outliers)
+        return _REPORT_TEMPLATE.format(
+            outliers=outliers_block,
+            low=len(groups['low']),
+            medium=len(groups['medium']),
+            high=len(groups['high']),
+            **stats
+        )
     
     @staticmethod
     def save_report_to_file(report: str, filename: str) -> None:
-        with open(filename, 'w') as f:
-            f.write(report)
+        # Бинарный режим: одна запись готовых байтов без перекодирования и замены переводов строк
+        with open(filename, 'wb') as f:
+            f.write(report.encode('utf-8'))
 
 def example_usage():
     # Генерация данных
@@ -166,15 +323,61 @@ def complex_operation(x: int, y: int, z: Optional[int] = None) -> float:
     
     return result * math.pi
 
+_COMPLEX_OPERATION_SOURCE = '''
+def complex_operation_z(x, y):
+    result = x * y / {z!r}
+    return math.log(result if result > 0 else abs(result) + 1) * math.pi
+'''
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _make_complex_operation(z: int | float):
+    # z подставляется в исходник литералом: проверки z is None / z == 0
+    # выполняются один раз здесь, а не на каждом вызове
+    namespace = {'math': math}
+    exec(_COMPLEX_OPERATION_SOURCE.format(z=z), namespace)
+    return namespace['complex_operation_z']
+
+def make_complex_operation(z: numbers.Real):
+    """Возвращает complex_operation(x, y, z), специализированную для постоянного z"""
+    if not isinstance(z, numbers.Real) or isinstance(z, bool):
+        raise TypeError("z должен быть вещественным числом")
+    # В исходник попадает только repr встроенного int/float; скаляры NumPy
+    # (np.int64, np.float64 из перебора по массиву) приводятся к ним здесь
+    z = int(z) if isinstance(z, numbers.Integral) else float(z)
+    if isinstance(z, float) and not math.isfinite(z):
+        raise ValueError("z должен быть конечным")
+    if z == 0:
+        raise ValueError("z не может быть нулем")
+    return _make_complex_operation(z)
+
+def complex_operation_batch(x: np.ndarray, y: np.ndarray,
+                            z: Optional[np.ndarray] = None) -> np.ndarray:
+    """Векторная версия complex_operation для массивов одинаковой формы"""
+    if np is None:
+        raise ImportError("complex_operation_batch требует NumPy")
+    result = np.asarray(x, dtype=np.float64) * np.asarray(y, dtype=np.float64)
+    if z is not None:
+        z = np.asarray(z, dtype=np.float64)
+        if not z.all():
+            raise ValueError("z не может быть нулем")
+        result /= z
+    
+    # Основание выбирается до логарифма, чтобы не считать log от отрицательных
+    log_base = np.where(result > 0, result, np.abs(result) + 1)
+    return np.log(log_base) * math.pi
+
 def validate_input(value: str) -> Tuple[bool, Optional[int]]:
     """Проверяет ввод пользователя"""
-    try:
-        num = int(value)
-        if num < 0:
-            return False, None
-        return True, num
-    except ValueError:
+    # Отрицательные числа и мусор отсекаются без создания int и без исключений;
+    # isdecimal (в отличие от isdigit) пропускает ровно те цифры, что понимает int()
+    digits = value.strip().removeprefix('+')
+    if not digits.isdecimal():
+        return False, None
+    # Слишком длинную строку int() не примет (ValueError) — отклоняем заранее
+    max_digits = sys.get_int_max_str_digits()
+    if max_digits and len(digits) > max_digits:
         return False, None
+    return True, int(digits)
 
 def process_user_input():
     """Обрабатывает ввод пользователя"""
@@ -1,87 +1,206 @@
-import random
+from __future__ import annotations
+
+import functools
 import math
-from typing import List, Dict, Tuple, Optional
+import numbers
+import random
+import sys
+from array import array
+from typing import List, Dict, Tuple, Optional, Sequence
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
-class DataTransformer:
-    """Преобразует данные по заданным правилам"""
-    @staticmethod
-    def transform_even_number(num: int) -> float:
-        return num ** 2
-    
-    @staticmethod
-    def transform_odd_number(num: int) -> float:
-        return math.sqrt(abs(num))
+try:
+    import numpy as np
+except ImportError:  # без NumPy работают запасные пути на чистом Python
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # без Numba ядра выполняются как обычные функции Python
+    prange = range
     
-    @staticmethod
-    def adjust_value_range(value: float) -> float:
-        if value > 100:
-            return value / 10
-        if value < 1:
-            return value * 10
-        return value
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _process_kernel(arr: np.ndarray) -> np.ndarray:
+    """Поэлементное преобразование: квадрат/корень и приведение к диапазону"""
+    n = arr.size
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        x = arr[i]
+        # Четность через младший бит: в дополнительном коде верно и для
+        # отрицательных чисел, и векторизуется проще, чем x % 2
+        r = float(x * x) if (x & 1) == 0 else math.sqrt(abs(x))
+        # Приведение к диапазону без ветвлений: множители выбираются через select.
+        # Деление на 10 (а не умножение на 0.1) сохраняет результат бит в бит
+        up = 10.0 if r < 1.0 else 1.0
+        down = 10.0 if r > 100.0 else 1.0
+        out[i] = r * up / down
+    return out
+
+def _transform(num: int) -> float:
+    """Скалярное преобразование на числах Python (запасной путь для ядра)"""
+    # % 2, а не & 1: на этот путь попадают и дробные числа
+    value = num * num if num % 2 == 0 else math.sqrt(abs(num))
+    if value > 100:
+        return value / 10
+    if value < 1:
+        return value * 10
+    return value
+
+# Ядро считает x * x в int64 и переводит в float64. Результат точен (и совпадает
+# с _transform на длинных целых), только пока x * x <= 2**53
+_KERNEL_MAX_ABS = 94906265
+
+def _kernel_input(data: np.ndarray) -> Optional[np.ndarray]:
+    """int64-массив для _process_kernel или None, если данные нужно считать на Python"""
+    # Дробные, длинные (dtype object) и прочие нецелые данные в ядро не идут:
+    # приведение к int64 молча обрезало бы дроби и заворачивало бы uint64
+    if data.dtype.kind not in 'iu':
+        return None
+    if data.max() > _KERNEL_MAX_ABS or data.min() < -_KERNEL_MAX_ABS:
+        return None
+    return data.astype(np.int64, copy=False)
+
+if np is not None:
+    # Компиляция (или загрузка из кэша) при импорте, а не на первом вызове
+    _process_kernel(np.zeros(1, dtype=np.int64))
+
+@njit(cache=True)
+def _stats_kernel(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """Среднее, стандартное отклонение, минимум и максимум за один проход (Welford)"""
+    # Без fastmath: ядро должно корректно видеть NaN и inf во входе
+    mean = 0.0
+    m2 = 0.0
+    total = 0.0
+    finite = True
+    n = len(values)
+    min_val = values[0]
+    max_val = values[0]
+    for i in range(n):
+        x = values[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += (x - mean) * delta
+        total += x
+        if not math.isfinite(x):
+            finite = False
+        if x < min_val:
+            min_val = x
+        if x > max_val:
+            max_val = x
+    if not finite:
+        # На inf поправка Welford дает inf - inf = NaN; как и прямая формула,
+        # берем среднее как сумму / n, а отклонение от бесконечного среднего — NaN
+        return total / n, math.nan, float(min_val), float(max_val)
+    return float(mean), math.sqrt(m2 / n), float(min_val), float(max_val)
+
+# F(92) — последнее число Фибоначчи, помещающееся в int64
+_FIB_INT64_MAX_LENGTH = 93
+
+@njit(cache=True)
+def _fib_kernel(n: int) -> np.ndarray:
+    """Первые n (n >= 1) чисел Фибоначчи в массиве int64"""
+    out = np.empty(n, dtype=np.int64)
+    out[0] = 0
+    if n > 1:
+        out[1] = 1
+    for i in range(2, n):
+        out[i] = out[i - 1] + out[i - 2]
+    return out
+
+_rng = np.random.default_rng() if np is not None else None
+
+def _as_float_array(values: Sequence[float]) -> np.ndarray | array:
+    """Плотный массив float64 из последовательности; готовый массив не копируется"""
+    if np is None:
+        if isinstance(values, array) and values.typecode == 'd':
+            return values
+        return array('d', values)
+    return np.asarray(values, dtype=np.float64)
 
 class DataStatisticsCalculator:
     """Вычисляет статистические показатели данных"""
     @staticmethod
-    def calculate_mean(values: List[float]) -> float:
-        return sum(values) / len(values)
+    def calculate_mean(values: Sequence[float]) -> float:
+        return _stats_kernel(_as_float_array(values))[0]
     
     @staticmethod
-    def calculate_standard_deviation(values: List[float]) -> float:
-        mean = DataStatisticsCalculator.calculate_mean(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return math.sqrt(variance)
+    def calculate_standard_deviation(values: Sequence[float]) -> float:
+        return _stats_kernel(_as_float_array(values))[1]
     
     @staticmethod
-    def calculate_basic_stats(values: List[float]) -> Dict[str, float]:
+    def calculate_basic_stats(values: Sequence[float]) -> Dict[str, float]:
+        mean, std_dev, min_val, max_val = _stats_kernel(_as_float_array(values))
         return {
-            'mean': DataStatisticsCalculator.calculate_mean(values),
-            'max': max(values),
-            'min': min(values),
-            'std_dev': DataStatisticsCalculator.calculate_standard_deviation(values)
+            'mean': mean,
+            'max': max_val,
+            'min': min_val,
+            'std_dev': std_dev
         }
 
 @dataclass
 class ProcessedData:
     """Хранит результаты обработки данных"""
-    values: List[float]
+    values: np.ndarray | array
     is_processed: bool = False
+    stats: Optional[Dict[str, float]] = None
 
 class DataProcessor:
     def __init__(self, data: List[int]):
         self.raw_data = data
-        self._results = ProcessedData([], False)
+        self._results = ProcessedData(array('d'), False)
+        self._version = 0
     
     def process_data(self) -> None:
         """Обрабатывает данные, выполняя различные операции"""
-        if not self.raw_data:
+        if len(self.raw_data) == 0:
             raise ValueError("Данные не могут быть пустыми")
         
-        transformed_values = []
-        for num in self.raw_data:
-            transformed = (DataTransformer.transform_even_number(num) 
-                          if num % 2 == 0 
-                          else DataTransformer.transform_odd_number(num))
-            adjusted = DataTransformer.adjust_value_range(transformed)
-            transformed_values.append(adjusted)
-        
-        self._results = ProcessedData(transformed_values, True)
+        if np is None:
+            values = array('d', map(_transform, self.raw_data))
+        else:
+            data = np.asarray(self.raw_data)
+            arr = _kernel_input(data)
+            if arr is None:
+                # tolist() дает числа Python: длинные целые не переполняются, как без NumPy
+                values = np.fromiter(map(_transform, data.tolist()), dtype=np.float64, count=data.size)
+            else:
+                values = _process_kernel(arr)
+        self._results = ProcessedData(values, True)
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Номер последней обработки; увеличивается при каждом process_data"""
+        return self._version
     
     def get_results(self) -> List[float]:
+        if not self._results.is_processed:
+            self.process_data()
+        return self._results.values.tolist()
+    
+    def get_results_array(self) -> np.ndarray | array:
+        """Возвращает результаты в виде непрерывного массива float64 (array('d') без NumPy)"""
         if not self._results.is_processed:
             self.process_data()
         return self._results.values
     
     def calculate_stats(self) -> Dict[str, float]:
-        return DataStatisticsCalculator.calculate_basic_stats(self.get_results())
+        values = self.get_results_array()
+        if self._results.stats is None:
+            self._results.stats = DataStatisticsCalculator.calculate_basic_stats(values)
+        return dict(self._results.stats)
 
 class DataGenerator:
     """Генерирует различные типы данных"""
     @staticmethod
-    def generate_random_data(size: int = 100, min_val: int = -50, max_val: int = 50) -> List[int]:
-        return [random.randint(min_val, max_val) for _ in range(size)]
+    def generate_random_data(size: int = 100, min_val: int = -50, max_val: int = 50) -> np.ndarray | List[int]:
+        if np is None:
+            return [random.randint(min_val, max_val) for _ in range(size)]
+        return _rng.integers(min_val, max_val + 1, size=size, dtype=np.int64)
     
     @staticmethod
     def generate_fibonacci_sequence(length: int) -> List[int]:
@@ -89,65 +208,127 @@ class DataGenerator:
             return []
         if length == 1:
             return [0]
+        if np is not None and length <= _FIB_INT64_MAX_LENGTH:
+            return _fib_kernel(length).tolist()
         
-        sequence = [0, 1]
-        while len(sequence) < length:
-            sequence.append(sequence[-1] + sequence[-2])
-        return sequence[:length]
+        # Дальше int64 переполняется (или нет NumPy) — считаем на длинных целых Python
+        sequence = [0] * length
+        sequence[1] = 1
+        for i in range(2, length):
+            sequence[i] = sequence[i - 1] + sequence[i - 2]
+        return sequence
+
+# Правая граница среднего диапазона включительная, поэтому берется следующее за 50.0 число
+_RANGE_EDGES = np.array([10.0, np.nextafter(50.0, np.inf)]) if np is not None else None
 
 class DataAnalyzer:
     """Анализирует обработанные данные"""
     def __init__(self, processor: DataProcessor):
         self.processor = processor
+        self._results_view: Optional[np.ndarray | array] = None
+        self._results_version = -1
+    
+    @property
+    def results(self) -> np.ndarray | array:
+        """Массив результатов процессора; запоминается до следующего process_data"""
+        if self._results_version != self.processor.version:
+            self._results_view = self.processor.get_results_array()
+            self._results_version = self.processor.version
+        return self._results_view
     
-    def find_outliers(self, threshold: float = 2.0) -> List[Tuple[int, float]]:
-        results = self.processor.get_results()
-        stats = self.processor.calculate_stats()
+    def find_outliers(self, threshold: float = 2.0,
+                      stats: Optional[Dict[str, float]] = None) -> List[Tuple[int, float]]:
+        """Ищет выбросы; stats можно передать, если статистика уже посчитана"""
+        values = self.results
+        if stats is None:
+            stats = self.processor.calculate_stats()
         mean = stats['mean']
         std_dev = stats['std_dev']
         
-        return [
-            (idx, value) 
-            for idx, value in enumerate(results) 
-            if abs(value - mean) > threshold * std_dev
-        ]
+        if np is None:
+            limit = threshold * std_dev
+            return [(idx, value) for idx, value in enumerate(values) if abs(value - mean) > limit]
+        
+        mask = np.abs(values - mean) > threshold * std_dev
+        idx = np.flatnonzero(mask)
+        return list(zip(idx.tolist(), values[mask].tolist()))
     
     def group_values_by_ranges(self) -> Dict[str, List[float]]:
-        results = self.processor.get_results()
+        values = self.results
+        if np is None:
+            groups = {'low': [], 'medium': [], 'high': []}
+            add_low, add_medium, add_high = (groups['low'].append,
+                                             groups['medium'].append,
+                                             groups['high'].append)
+            for v in values:
+                if v < 10:
+                    add_low(v)
+                elif v <= 50:
+                    add_medium(v)
+                else:
+                    add_high(v)
+            return groups
+        
+        # 0: v < 10, 1: 10 <= v <= 50, 2: v > 50
+        bins = np.digitize(values, _RANGE_EDGES)
         return {
-            'low': [v for v in results if v < 10],
-            'medium': [v for v in results if 10 <= v <= 50],
-            'high': [v for v in results if v > 50]
+            'low': values[bins == 0].tolist(),
+            'medium': values[bins == 1].tolist(),
+            'high': values[bins == 2].tolist()
         }
 
+_REPORT_TEMPLATE = (
+    "=== Статистический отчет ===\n"
+    "Среднее значение: {mean:.2f}\n"
+    "Максимальное значение: {max:.2f}\n"
+    "Минимальное значение: {min:.2f}\n"
+    "Стандартное отклонение: {std_dev:.2f}\n"
+    "\n=== Выбросы ===\n"
+    "{outliers}"
+    "\n=== Группировка значений ===\n"
+    "Низкие значения (кол-во): {low}\n"
+    "Средние значения (кол-во): {medium}\n"
+    "Высокие значения (кол-во): {high}"
+)
+
 class ReportGenerator:
     """Генерирует отчеты по анализу данных"""
     @staticmethod
     def generate_text_report(analyzer: DataAnalyzer) -> str:
         stats = analyzer.processor.calculate_stats()
-        outliers = analyzer.find_outliers()
+        outliers = analyzer.find_outliers(stats=stats)
         groups = analyzer.group_values_by_ranges()
         
-        report_lines = [
-            "=== Статистический отчет ===",
-            f"Среднее значение: {stats['mean']:.2f}",
-            f"Максимальное значение: {stats['max']:.2f}",
-            f"Минимальное значение: {stats['min']:.2f}",
-            f"Стандартное отклонение: {stats['std_dev']:.2f}",
-            "\n=== Выбросы ===",
-            *[f"Индекс {idx}: {value:.2f}" for idx, value in outliers],
-            "\n=== Группировка значений ===",
-            f"Низкие значения (кол-во): {len(groups['low'])}",
-            f"Средние значения (кол-во): {len(groups['medium'])}",
-            f"Высокие значения (кол-во): {len(groups['high'])}"
-        ]
-        
-        return "\n".join(report_lines)
+        # Каждая строка выброса заканчивается переводом строки — шаблон не добавляет своих
+        outliers_block = "".join(f"Индекс {idx}: {value:.2f}\n" for idx, value in outliers)
+        return _REPORT_TEMPLATE.format(
+            outliers=outliers_block,
+            low=len(groups['low']),
+            medium=len(groups['medium']),
+            high=len(groups['high']),
+            **stats
+        )
     
     @staticmethod
     def save_report_to_file(report: str, filename: str) -> None:
-        with open(filename, 'w') as file:
-            file.write(report)
+        # Бинарный режим: одна запись готовых байтов без перекодирования и замены переводов строк
+        with open(filename, 'wb') as file:
+            file.write(report.encode('utf-8'))
+
+_COMPLEX_CALCULATION_SOURCE = '''
+def complex_calculation_z(x, y):
+    result = x * y / {z!r}
+    log_base = result if result > 0 else abs(result) + 1
+    return math.log(log_base) * math.pi
+'''
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _make_complex_calculation(z: int | float):
+    # z подставляется в исходник литералом: проверки z is None / z == 0
+    # выполняются один раз здесь, а не на каждом вызове
+    namespace = {'math': math}
+    exec(_COMPLEX_CALCULATION_SOURCE.format(z=z), namespace)
+    return namespace['complex_calculation_z']
 
 class MathOperations:
     """Выполняет сложные математические операции"""
@@ -162,17 +343,52 @@ class MathOperations:
         
         log_base = result if result > 0 else abs(result) + 1
         return math.log(log_base) * math.pi
+    
+    @staticmethod
+    def make_complex_calculation(z: numbers.Real):
+        """Возвращает perform_complex_calculation(x, y, z) для постоянного z"""
+        if not isinstance(z, numbers.Real) or isinstance(z, bool):
+            raise TypeError("z должен быть вещественным числом")
+        # В исходник попадает только repr встроенного int/float; скаляры NumPy
+        # (np.int64, np.float64 из перебора по массиву) приводятся к ним здесь
+        z = int(z) if isinstance(z, numbers.Integral) else float(z)
+        if isinstance(z, float) and not math.isfinite(z):
+            raise ValueError("z должен быть конечным")
+        if z == 0:
+            raise ValueError("Делитель не может быть нулем")
+        return _make_complex_calculation(z)
+    
+    @staticmethod
+    def perform_complex_calculation_batch(x: np.ndarray, y: np.ndarray,
+                                          z: Optional[np.ndarray] = None) -> np.ndarray:
+        """Векторная версия perform_complex_calculation для массивов одинаковой формы"""
+        if np is None:
+            raise ImportError("perform_complex_calculation_batch требует NumPy")
+        result = np.asarray(x, dtype=np.float64) * np.asarray(y, dtype=np.float64)
+        if z is not None:
+            z = np.asarray(z, dtype=np.float64)
+            if not z.all():
+                raise ValueError("Делитель не может быть нулем")
+            result /= z
+        
+        log_base = np.where(result > 0, result, np.abs(result) + 1)
+        return np.log(log_base) * math.pi
 
 class InputValidator:
     """Проверяет и обрабатывает пользовательский ввод"""
     @staticmethod
     def validate_positive_integer(value: str) -> Tuple[bool, Optional[int]]:
         """Проверяет, что введено положительное целое число"""
-        try:
-            num = int(value)
-            return (num >= 0), num if num >= 0 else None
-        except ValueError:
+        # Отрицательные числа и мусор отсекаются без создания int и без исключений;
+        # isdecimal (в отличие от isdigit) пропускает ровно те цифры, что понимает int()
+        digits = value.strip().removeprefix('+')
+        if not digits.isdecimal():
+            return False, None
+        # Слишком длинную строку int() не примет (ValueError) — отклоняем заранее
+        max_digits = sys.get_int_max_str_digits()
+        if max_digits and len(digits) > max_digits:
             return False, None
+        return True, int(digits)
     
     @staticmethod
     def process_user_input():